@@ -6,15 +6,79 @@ A comprehensive Python application for analyzing and visualizing datasets
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import pyarrow.json as paj
 from datetime import datetime
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 import os
-from typing import Dict, List, Tuple, Optional
+import functools
+from typing import Any, Dict, Iterator, List, Tuple, Optional, TYPE_CHECKING
 import warnings
 warnings.filterwarnings('ignore')
 
+if TYPE_CHECKING:
+    import matplotlib.axes
+
+@functools.lru_cache(maxsize=None)
+def _describe_kernel():
+    """Build the numeric summary kernel on first use, keeping numba out of module import"""
+    from numba import njit, prange
+    
+    @njit(parallel=True, cache=True)
+    def describe_columns(block: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Single pass count/mean/std/min/max over each row of a (columns, rows) block, skipping NaN"""
+        k, n = block.shape
+        count = np.zeros(k)
+        mean, std = np.full(k, np.nan), np.full(k, np.nan)
+        col_min, col_max = np.full(k, np.nan), np.full(k, np.nan)
+        
+        for j in prange(k):
+            c, total, total_sq = 0, 0.0, 0.0
+            shift, lo, hi = 0.0, np.inf, -np.inf
+            for i in range(n):
+                v = block[j, i]
+                if np.isnan(v):
+                    continue
+                # Sums are taken around the first value to keep the variance numerically stable
+                if c == 0:
+                    shift = v
+                d = v - shift
+                c += 1
+                total += d
+                total_sq += d * d
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+        
+            count[j] = c
+            if c > 0:
+                mean[j] = shift + total / c
+                col_min[j], col_max[j] = lo, hi
+            if c > 1:
+                std[j] = np.sqrt(max((total_sq - total * total / c) / (c - 1), 0.0))
+        
+        return count, mean, std, col_min, col_max
+    
+    return describe_columns
+
+def _top_k_counts(values: np.ndarray, k: int = 5) -> Dict[Any, int]:
+    """Return the k most frequent non-null values with their counts"""
+    values = values[pd.notna(values)]
+    if values.size == 0:
+        return {}
+    
+    try:
+        uniques, counts = np.unique(values, return_counts=True)
+    except TypeError:
+        # Mixed types cannot be sorted together, so let pandas hash them
+        return pd.Series(values).value_counts().head(k).to_dict()
+    
+    k = min(k, counts.size)
+    top = np.sort(np.argpartition(-counts, k - 1)[:k])
+    order = top[np.argsort(-counts[top], kind='stable')]
+    return dict(zip(uniques[order].tolist(), counts[order].tolist()))
+
 class DataAnalyzer:
     """Main class for data analysis and visualization"""
     
@@ -22,6 +86,22 @@ class DataAnalyzer:
         self.data = None
         self.data_path = data_path
         self.analysis_results = {}
+    
+    @property
+    def data(self) -> Optional[pd.DataFrame]:
+        """Currently loaded dataset"""
+        return self._data
+    
+    @data.setter
+    def data(self, value: Optional[pd.DataFrame]) -> None:
+        # Partition the columns by dtype once per assignment rather than on every analysis call
+        self._data = value
+        if value is None:
+            self._numeric_cols, self._object_cols, self._datetime_cols = [], [], []
+        else:
+            self._numeric_cols = value.select_dtypes(include=[np.number]).columns.tolist()
+            self._object_cols = value.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+            self._datetime_cols = value.select_dtypes(include=['datetime64']).columns.tolist()
         
     def load_data(self, data_path: str = None) -> bool:
         """Load data from various file formats"""
@@ -35,11 +115,11 @@ class DataAnalyzer:
             file_extension = self.data_path.split('.')[-1].lower()
             
             if file_extension == 'csv':
-                self.data = pd.read_csv(self.data_path)
+                self.data = pd.read_csv(self.data_path, engine='pyarrow', dtype_backend='pyarrow')
             elif file_extension in ['xlsx', 'xls']:
-                self.data = pd.read_excel(self.data_path)
-            elif file_extension == 'json':
-                self.data = pd.read_json(self.data_path)
+                self.data = self._read_excel(self.data_path)
+            elif file_extension in ['json', 'jsonl', 'ndjson']:
+                self.data = self._read_json(self.data_path)
             else:
                 print(f"Unsupported file format: {file_extension}")
                 return False
@@ -51,24 +131,82 @@ class DataAnalyzer:
             print(f"Error loading data: {e}")
             return False
     
+    def _read_json(self, data_path: str) -> pd.DataFrame:
+        """Read newline-delimited JSON with PyArrow and other JSON layouts with pandas"""
+        if data_path.split('.')[-1].lower() in ['jsonl', 'ndjson']:
+            return paj.read_json(data_path).to_pandas(types_mapper=pd.ArrowDtype)
+        
+        # pyarrow reads a single JSON object as one row of structs, so any orient
+        # pandas can write (columns, records, ...) has to go through pd.read_json
+        try:
+            return pd.read_json(data_path, dtype_backend='pyarrow')
+        except ValueError:
+            # Line-delimited records saved with a .json extension
+            return paj.read_json(data_path).to_pandas(types_mapper=pd.ArrowDtype)
+    
+    def _read_excel(self, data_path: str) -> pd.DataFrame:
+        """Read Excel with the calamine engine when it is installed"""
+        try:
+            return pd.read_excel(data_path, engine='calamine', dtype_backend='pyarrow')
+        except ImportError:
+            return pd.read_excel(data_path, dtype_backend='pyarrow')
+    
+    def load_data_chunked(self, data_path: str = None, chunksize: int = 2_000_000) -> Iterator[pd.DataFrame]:
+        """Stream a CSV file in chunks of rows instead of loading it whole"""
+        if data_path:
+            self.data_path = data_path
+        
+        if not self.data_path or self.data_path.split('.')[-1].lower() != 'csv':
+            raise ValueError("Chunked loading is only supported for CSV files")
+        
+        return self._read_csv_chunks(self.data_path, chunksize)
+    
+    def _read_csv_chunks(self, data_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Yield CSV chunks that all share the column types sniffed from the file's head"""
+        # Per-chunk inference can flip a column between numeric and text partway through
+        sample = pd.read_csv(data_path, nrows=min(chunksize, 100_000))
+        numeric = sample.select_dtypes(include=[np.number])
+        # A column that is empty in the sample may still hold text further down
+        numeric_cols = numeric.columns[numeric.notna().any()].tolist()
+        text_cols = {col: object for col in sample.columns if col not in numeric_cols}
+        
+        # The pyarrow engine does not support chunksize, so streaming uses the C parser
+        with pd.read_csv(data_path, chunksize=chunksize, dtype=text_cols) as reader:
+            for chunk in reader:
+                # A stray non-numeric token becomes NaN instead of turning the column to text
+                if numeric_cols:
+                    chunk[numeric_cols] = chunk[numeric_cols].apply(pd.to_numeric, errors='coerce')
+                yield chunk
+    
     def generate_sample_data(self) -> None:
         """Generate sample dataset for demonstration"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         dates = pd.date_range('2023-01-01', periods=1000, freq='D')
         
         self.data = pd.DataFrame({
             'date': dates,
-            'sales': np.random.normal(1000, 200, 1000),
-            'customers': np.random.poisson(50, 1000),
-            'product_category': np.random.choice(['Electronics', 'Clothing', 'Books', 'Home'], 1000),
-            'region': np.random.choice(['North', 'South', 'East', 'West'], 1000),
-            'satisfaction_score': np.random.uniform(1, 5, 1000)
+            'sales': rng.normal(1000, 200, 1000).astype(np.float32),
+            'customers': rng.poisson(50, 1000).astype(np.int32),
+            'product_category': pd.Categorical.from_codes(
+                rng.integers(0, 4, 1000, dtype=np.int8),
+                categories=['Electronics', 'Clothing', 'Books', 'Home']
+            ),
+            'region': pd.Categorical.from_codes(
+                rng.integers(0, 4, 1000, dtype=np.int8),
+                categories=['North', 'South', 'East', 'West']
+            ),
+            'satisfaction_score': rng.uniform(1, 5, 1000).astype(np.float32)
         })
         
         print("Sample data generated successfully!")
     
-    def basic_statistics(self) -> Dict:
+    def basic_statistics(self, chunksize: Optional[int] = None, quantiles: bool = False) -> Dict:
         """Calculate basic statistical measures"""
+        if chunksize:
+            stats = self._streaming_statistics(chunksize)
+            self.analysis_results['basic_statistics'] = stats
+            return stats
+        
         if self.data is None:
             return {}
             
@@ -77,40 +215,239 @@ class DataAnalyzer:
             'columns': list(self.data.columns),
             'data_types': self.data.dtypes.to_dict(),
             'missing_values': self.data.isnull().sum().to_dict(),
-            'numeric_summary': self.data.describe().to_dict() if self.data.select_dtypes(include=[np.number]).shape[1] > 0 else {},
+            'numeric_summary': self._numeric_summary(quantiles) if self._numeric_cols else {},
             'categorical_summary': {}
         }
         
         # Categorical columns summary
-        categorical_cols = self.data.select_dtypes(include=['object']).columns
-        for col in categorical_cols:
+        for col in self._object_cols:
             stats['categorical_summary'][col] = {
                 'unique_values': self.data[col].nunique(),
-                'most_common': self.data[col].value_counts().head(5).to_dict()
+                'most_common': _top_k_counts(self.data[col].to_numpy())
             }
         
         self.analysis_results['basic_statistics'] = stats
         return stats
     
-    def correlation_analysis(self) -> pd.DataFrame:
+    def _numeric_summary(self, quantiles: bool = False) -> Dict:
+        """Summarize numeric columns in one pass; quartiles need a sort so are opt-in"""
+        block = np.ascontiguousarray(
+            self.data[self._numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan).T
+        )
+        count, mean, std, col_min, col_max = _describe_kernel()(block)
+        
+        summary = {}
+        for i, col in enumerate(self._numeric_cols):
+            col_stats = {'count': float(count[i]), 'mean': float(mean[i]), 'std': float(std[i]),
+                         'min': float(col_min[i])}
+            if quantiles:
+                q25, q50, q75 = np.nanquantile(block[i], [0.25, 0.5, 0.75])
+                col_stats.update({'25%': float(q25), '50%': float(q50), '75%': float(q75)})
+            col_stats['max'] = float(col_max[i])
+            summary[col] = col_stats
+        return summary
+    
+    def _streaming_statistics(self, chunksize: int) -> Dict:
+        """Calculate basic statistics one chunk at a time with merged running moments"""
+        n_rows = 0
+        columns, data_types = [], {}
+        numeric_cols = None
+        value_counts = {}
+        
+        for chunk in self.load_data_chunked(chunksize=chunksize):
+            if numeric_cols is None:
+                columns = list(chunk.columns)
+                data_types = chunk.dtypes.to_dict()
+                missing = pd.Series(0, index=chunk.columns)
+                numeric_cols = chunk.select_dtypes(include=[np.number]).columns
+                categorical_cols = chunk.select_dtypes(include=['object', 'string']).columns
+                value_counts = {col: pd.Series(dtype=np.int64) for col in categorical_cols}
+                
+                k = len(numeric_cols)
+                count, mean, m2 = np.zeros(k), np.zeros(k), np.zeros(k)
+                col_min, col_max = np.full(k, np.inf), np.full(k, -np.inf)
+            
+            n_rows += len(chunk)
+            missing = missing.add(chunk.isnull().sum(), fill_value=0)
+            for col in value_counts:
+                value_counts[col] = value_counts[col].add(chunk[col].value_counts(), fill_value=0)
+            
+            # Welford/Chan merge of this chunk's moments into the running totals
+            values = chunk[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            chunk_count = (~np.isnan(values)).sum(axis=0)
+            chunk_mean = np.divide(np.nansum(values, axis=0), chunk_count,
+                                   out=np.zeros(k), where=chunk_count > 0)
+            chunk_m2 = np.nansum((values - chunk_mean) ** 2, axis=0)
+            
+            total = count + chunk_count
+            delta = chunk_mean - mean
+            mean = mean + np.divide(delta * chunk_count, total, out=np.zeros(k), where=total > 0)
+            m2 = m2 + chunk_m2 + np.divide(delta ** 2 * count * chunk_count, total,
+                                           out=np.zeros(k), where=total > 0)
+            count = total
+            col_min = np.fmin(col_min, np.fmin.reduce(values, axis=0, initial=np.inf))
+            col_max = np.fmax(col_max, np.fmax.reduce(values, axis=0, initial=-np.inf))
+        
+        if numeric_cols is None:
+            return {}
+        
+        std = np.sqrt(np.divide(m2, count - 1, out=np.full(k, np.nan), where=count > 1))
+        numeric_summary = {
+            col: {
+                'count': float(count[i]),
+                'mean': float(mean[i]) if count[i] else np.nan,
+                'std': float(std[i]),
+                'min': float(col_min[i]) if count[i] else np.nan,
+                'max': float(col_max[i]) if count[i] else np.nan
+            }
+            for i, col in enumerate(numeric_cols)
+        }
+        
+        categorical_summary = {}
+        for col, counts in value_counts.items():
+            counts = counts.astype(np.int64).sort_values(ascending=False)
+            categorical_summary[col] = {
+                'unique_values': len(counts),
+                'most_common': counts.head(5).to_dict()
+            }
+        
+        return {
+            'shape': (n_rows, len(columns)),
+            'columns': columns,
+            'data_types': data_types,
+            'missing_values': missing.astype(np.int64).to_dict(),
+            'numeric_summary': numeric_summary,
+            'categorical_summary': categorical_summary
+        }
+    
+    def correlation_analysis(self, chunksize: Optional[int] = None) -> pd.DataFrame:
         """Perform correlation analysis on numeric columns"""
+        if chunksize:
+            correlation_matrix = self._streaming_correlation(chunksize)
+            if not correlation_matrix.empty:
+                self.analysis_results['correlation_matrix'] = correlation_matrix
+            return correlation_matrix
+        
         if self.data is None:
             return pd.DataFrame()
             
-        numeric_data = self.data.select_dtypes(include=[np.number])
+        numeric_data = self.data[self._numeric_cols]
         if numeric_data.shape[1] < 2:
             print("Not enough numeric columns for correlation analysis")
             return pd.DataFrame()
             
-        correlation_matrix = numeric_data.corr()
+        # Variables-as-rows block lets np.corrcoef run as a single GEMM. It stays float64:
+        # in float32 a column with a large offset loses most of its significant digits
+        values = np.ascontiguousarray(numeric_data.to_numpy(dtype=np.float64, na_value=np.nan).T)
+        has_nan = np.isnan(values).any(axis=1)
+        columns = numeric_data.columns
+        
+        correlation = np.empty((len(columns), len(columns)))
+        clean = np.flatnonzero(~has_nan)
+        if len(clean) > 0:
+            correlation[np.ix_(clean, clean)] = np.corrcoef(values[clean])
+        
+        # Columns with missing values need pandas' pairwise-complete handling
+        for i in np.flatnonzero(has_nan):
+            pairwise = numeric_data.corrwith(numeric_data[columns[i]]).to_numpy()
+            correlation[i, :] = pairwise
+            correlation[:, i] = pairwise
+        
+        correlation_matrix = pd.DataFrame(correlation, index=columns, columns=columns)
         self.analysis_results['correlation_matrix'] = correlation_matrix
         return correlation_matrix
     
-    def create_visualizations(self, save_path: str = "visualizations") -> None:
+    def _streaming_correlation(self, chunksize: int) -> pd.DataFrame:
+        """Correlate numeric columns from pairwise sums accumulated over CSV chunks
+        
+        Like DataFrame.corr(), each pair uses the rows where both values are present.
+        """
+        numeric_cols = None
+        shift = None
+        
+        for chunk in self.load_data_chunked(chunksize=chunksize):
+            if numeric_cols is None:
+                numeric_cols = chunk.select_dtypes(include=[np.number]).columns
+                if len(numeric_cols) < 2:
+                    break
+                
+                k = len(numeric_cols)
+                n, sum_x, sum_xx, sum_xy = (np.zeros((k, k)) for _ in range(4))
+            
+            values = chunk[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            present = ~np.isnan(values)
+            if shift is None:
+                # Shifting by an early mean keeps the accumulated sums well conditioned
+                shift = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else np.zeros(k)
+            
+            # Zeroed missing values drop out of every product, so each sum is pairwise-complete
+            mask = present.astype(np.float64)
+            centered = np.where(present, values - shift, 0.0)
+            n += mask.T @ mask
+            sum_x += centered.T @ mask
+            sum_xx += (centered ** 2).T @ mask
+            sum_xy += centered.T @ centered
+        
+        if numeric_cols is None or len(numeric_cols) < 2:
+            print("Not enough numeric columns for correlation analysis")
+            return pd.DataFrame()
+        
+        # sum_x[i, j] sums column i over rows where column j is also present
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sum_xy - sum_x * sum_x.T / n
+            var_x = sum_xx - sum_x ** 2 / n
+            correlation = cov / np.sqrt(var_x * var_x.T)
+        correlation[n < 2] = np.nan
+        return pd.DataFrame(correlation, index=numeric_cols, columns=numeric_cols)
+    
+    def histogram_counts(self, bins: int = 50, chunksize: Optional[int] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Bin each numeric column, returning (counts, edges) per column"""
+        if not chunksize:
+            if self.data is None:
+                return {}
+            return {
+                col: np.histogram(self.data[col].dropna().to_numpy(dtype=np.float64), bins=bins)
+                for col in self._numeric_cols
+            }
+        
+        # Fixed edges come from the streamed min/max so chunk counts can be summed
+        summary = self._streaming_statistics(chunksize).get('numeric_summary', {})
+        edges = {
+            col: np.histogram_bin_edges([], bins=bins, range=(col_stats['min'], col_stats['max']))
+            for col, col_stats in summary.items() if col_stats['count']
+        }
+        counts = {col: np.zeros(bins, dtype=np.int64) for col in edges}
+        
+        for chunk in self.load_data_chunked(chunksize=chunksize):
+            for col, col_edges in edges.items():
+                values = chunk[col].dropna().to_numpy(dtype=np.float64)
+                counts[col] += np.histogram(values, bins=col_edges)[0]
+        
+        return {col: (counts[col], edges[col]) for col in edges}
+    
+    def _plot_kde(self, ax: 'matplotlib.axes.Axes', values: np.ndarray, edges: np.ndarray,
+                  max_points: int = 5000) -> None:
+        """Overlay a KDE fitted on a subsample, scaled to the histogram counts"""
+        from scipy.stats import gaussian_kde
+        
+        sample = values
+        if values.size > max_points:
+            sample = np.random.default_rng(42).choice(values, max_points, replace=False)
+        
+        kde = gaussian_kde(sample)
+        xs = np.linspace(edges[0], edges[-1], 200)
+        ax.plot(xs, kde(xs) * values.size * (edges[1] - edges[0]))
+    
+    def create_visualizations(self, save_path: str = "visualizations", show_kde: bool = False,
+                              dpi: int = 150) -> None:
         """Create comprehensive visualizations"""
         if self.data is None:
             print("No data loaded for visualization")
             return
+        
+        # Plotting libraries are heavy to import, so only load them when plotting
+        import matplotlib.pyplot as plt
+        import seaborn as sns
             
         # Create directory for saving plots
         os.makedirs(save_path, exist_ok=True)
@@ -119,66 +456,84 @@ class DataAnalyzer:
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
         
+        # Figures are built first and written together at the end
+        figures = []
+        
         # 1. Distribution plots for numeric columns
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._numeric_cols
         if len(numeric_cols) > 0:
             fig, axes = plt.subplots(2, 2, figsize=(15, 10))
             fig.suptitle('Distribution Analysis', fontsize=16, fontweight='bold')
             
             for i, col in enumerate(numeric_cols[:4]):
                 row, col_idx = i // 2, i % 2
-                sns.histplot(self.data[col], kde=True, ax=axes[row, col_idx])
+                values = self.data[col].dropna().to_numpy(dtype=np.float64)
+                counts, edges = np.histogram(values, bins=50)
+                axes[row, col_idx].bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7)
+                if show_kde and values.size > 1 and np.ptp(values) > 0:
+                    self._plot_kde(axes[row, col_idx], values, edges)
                 axes[row, col_idx].set_title(f'Distribution of {col}')
                 axes[row, col_idx].set_xlabel(col)
                 axes[row, col_idx].set_ylabel('Frequency')
             
-            plt.tight_layout()
-            plt.savefig(f'{save_path}/distributions.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            figures.append((fig, f'{save_path}/distributions.png'))
         
         # 2. Correlation heatmap
         correlation_matrix = self.correlation_analysis()
         if not correlation_matrix.empty:
-            plt.figure(figsize=(10, 8))
+            fig, ax = plt.subplots(figsize=(10, 8))
             sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
-                       square=True, linewidths=0.5)
-            plt.title('Correlation Heatmap', fontsize=16, fontweight='bold')
-            plt.tight_layout()
-            plt.savefig(f'{save_path}/correlation_heatmap.png', dpi=300, bbox_inches='tight')
-            plt.close()
+                       square=True, linewidths=0.5, ax=ax)
+            ax.set_title('Correlation Heatmap', fontsize=16, fontweight='bold')
+            fig.tight_layout()
+            figures.append((fig, f'{save_path}/correlation_heatmap.png'))
         
         # 3. Time series analysis (if date column exists)
-        date_cols = self.data.select_dtypes(include=['datetime64']).columns
+        date_cols = self._datetime_cols
         if len(date_cols) > 0:
             date_col = date_cols[0]
             numeric_col = numeric_cols[0] if len(numeric_cols) > 0 else None
             
             if numeric_col:
-                plt.figure(figsize=(15, 6))
-                self.data.plot(x=date_col, y=numeric_col, figsize=(15, 6))
-                plt.title(f'{numeric_col} Over Time', fontsize=16, fontweight='bold')
-                plt.xlabel('Date')
-                plt.ylabel(numeric_col)
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                plt.savefig(f'{save_path}/time_series.png', dpi=300, bbox_inches='tight')
-                plt.close()
+                fig, ax = plt.subplots(figsize=(15, 6))
+                self.data.plot(x=date_col, y=numeric_col, ax=ax)
+                ax.set_title(f'{numeric_col} Over Time', fontsize=16, fontweight='bold')
+                ax.set_xlabel('Date')
+                ax.set_ylabel(numeric_col)
+                ax.tick_params(axis='x', labelrotation=45)
+                fig.tight_layout()
+                figures.append((fig, f'{save_path}/time_series.png'))
         
         # 4. Categorical analysis
-        categorical_cols = self.data.select_dtypes(include=['object']).columns
+        categorical_cols = self._object_cols
         if len(categorical_cols) > 0:
             fig, axes = plt.subplots(2, 2, figsize=(15, 10))
             fig.suptitle('Categorical Analysis', fontsize=16, fontweight='bold')
             
             for i, col in enumerate(categorical_cols[:4]):
                 row, col_idx = i // 2, i % 2
-                value_counts = self.data[col].value_counts()
-                axes[row, col_idx].pie(value_counts.values, labels=value_counts.index, autopct='%1.1f%%')
+                value_counts = self.data[col].value_counts(dropna=False)
+                if len(value_counts) > 20:
+                    # Too many wedges to read or render; show the top 10 as bars instead
+                    top = value_counts.head(10)
+                    axes[row, col_idx].bar(range(len(top)), top.values)
+                    axes[row, col_idx].set_xticks(range(len(top)))
+                    axes[row, col_idx].set_xticklabels(top.index.astype(str), rotation=45, ha='right')
+                else:
+                    axes[row, col_idx].pie(value_counts.values, labels=value_counts.index.astype(str),
+                                           autopct='%1.1f%%')
                 axes[row, col_idx].set_title(f'Distribution of {col}')
             
-            plt.tight_layout()
-            plt.savefig(f'{save_path}/categorical_analysis.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            figures.append((fig, f'{save_path}/categorical_analysis.png'))
+        
+        # PNG encoding releases the GIL, so the figures are written in parallel
+        with ThreadPoolExecutor(max_workers=max(len(figures), 1)) as executor:
+            list(executor.map(lambda item: item[0].savefig(item[1], dpi=dpi, bbox_inches='tight'), figures))
+        
+        for fig, _ in figures:
+            plt.close(fig)
         
         print(f"Visualizations saved to {save_path}/")
     
@@ -195,8 +550,13 @@ class DataAnalyzer:
             'columns': list(self.data.columns) if self.data is not None else None
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(self.analysis_results, f, indent=2, default=str)
+        # Values orjson cannot encode natively (DataFrames, dtypes) fall back to str
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                self.analysis_results,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
         
         print(f"Analysis report exported to {output_path}")
 
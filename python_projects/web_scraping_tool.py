@@ -4,27 +4,96 @@ Web Scraping and API Integration Tool
 A comprehensive Python application for web scraping and API data collection
 """
 
-import requests
-import json
+import httpx
+import orjson
 import csv
 import time
+import math
+import threading
 import random
-from bs4 import BeautifulSoup
+import re
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator
 from urllib.parse import urljoin, urlparse
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 from datetime import datetime
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union, TYPE_CHECKING
 import logging
 from dataclasses import dataclass
 import asyncio
-import aiohttp
 from concurrent.futures import ThreadPoolExecutor
 import sqlite3
+import uuid
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; keep the tool's own progress messages readable
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# Precompiled patterns for text cleaning
+_CLEAN_RE = re.compile(r'[^\w\s\.\,\!\?\-\:]')
+_WS_RE = re.compile(r'\s+')
+
+# Shared connection pool sizing for the sync and async HTTP/2 clients
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+def _top_k_counts(values: np.ndarray, k: int = 5) -> Dict[Any, int]:
+    """Return the k most frequent non-null values with their counts"""
+    values = values[pd.notna(values)]
+    if values.size == 0:
+        return {}
+    
+    try:
+        uniques, counts = np.unique(values, return_counts=True)
+    except TypeError:
+        # Mixed types cannot be sorted together, so let pandas hash them
+        return pd.Series(values).value_counts().head(k).to_dict()
+    
+    k = min(k, counts.size)
+    top = np.sort(np.argpartition(-counts, k - 1)[:k])
+    order = top[np.argsort(-counts[top], kind='stable')]
+    return dict(zip(uniques[order].tolist(), counts[order].tolist()))
+
+def _mean_text_length(values: List[Any]) -> Optional[float]:
+    """Average character length of the string values, computed by Arrow's utf8_length kernel"""
+    try:
+        array = pa.array(values, type=pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed column: only its strings have a length
+        array = pa.array([value for value in values if isinstance(value, str)], type=pa.string())
+    return pc.mean(pc.utf8_length(array)).as_py()
+
+def _records_to_columns(records: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose records into columns over the union of their keys"""
+    keys = dict.fromkeys(key for record in records for key in record)
+    return {key: [record.get(key) for record in records] for key in keys}
+
+def _compile_selectors(selectors: Dict[str, str]) -> Dict[str, etree.XPath]:
+    """Translate CSS selectors to XPath once and compile them"""
+    translator = HTMLTranslator()
+    return {key: etree.XPath(translator.css_to_xpath(selector)) for key, selector in selectors.items()}
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name for use in SQLite statements"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _to_sql_value(value: Any) -> Any:
+    """Convert a value into something SQLite can store"""
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return str(value)
 
 @dataclass
 class ScrapingConfig:
@@ -33,57 +102,162 @@ class ScrapingConfig:
     headers: Dict[str, str]
     delay_range: tuple = (1, 3)
     max_retries: int = 3
+    max_backoff: float = 60.0
     timeout: int = 30
     max_pages: int = 10
+    max_concurrency: int = 5
+    db_path: Optional[str] = None
 
 class WebScraper:
     """Main class for web scraping operations"""
     
     def __init__(self, config: ScrapingConfig):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update(config.headers)
-        self.scraped_data = []
+        self.session = httpx.Client(http2=True, headers=config.headers, timeout=config.timeout,
+                                    limits=_HTTP_LIMITS, follow_redirects=True)
+        self._cols: Dict[str, List[Any]] = {}
+        self._n_rows = 0
         self.failed_urls = []
+        self._html_parser = lxml.html.HTMLParser()
+        self._xpath_cache: Dict[Tuple[Tuple[str, str], ...], Dict[str, etree.XPath]] = {}
         
+        # Optional append-only SQLite log of scraped rows, tagged with this scraper's run id
+        self.run_id = uuid.uuid4().hex
+        self._db = None
+        if config.db_path:
+            self._db = sqlite3.connect(config.db_path)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+    
+    def __enter__(self) -> 'WebScraper':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the HTTP client and the SQLite log"""
+        self.session.close()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        
+    @property
+    def scraped_data(self) -> List[Dict[str, Any]]:
+        """Scraped records, rebuilt from the column store"""
+        keys = list(self._cols)
+        return [dict(zip(keys, row)) for row in zip(*self._cols.values())]
+    
+    @scraped_data.setter
+    def scraped_data(self, records: List[Dict[str, Any]]) -> None:
+        self._cols = _records_to_columns(records)
+        self._n_rows = len(records)
+    
+    def _ensure_table(self, columns: List[str]) -> None:
+        """Create the scraped table, adding any columns it does not have yet"""
+        column_sql = ', '.join(_quote_identifier(column) for column in columns)
+        self._db.execute(f'CREATE TABLE IF NOT EXISTS scraped ({column_sql})')
+        # SQLite identifiers are case-insensitive, so compare names case-folded
+        existing = {row[1].lower() for row in self._db.execute('PRAGMA table_info(scraped)')}
+        for column in columns:
+            if column.lower() not in existing:
+                self._db.execute(f'ALTER TABLE scraped ADD COLUMN {_quote_identifier(column)}')
+    
+    def _persist_records(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the SQLite log in one batch"""
+        if self._db is None or not records:
+            return
+        
+        records = [{**record, 'run_id': self.run_id} for record in records]
+        
+        # Keys differing only in case map to one SQLite column, named after the first spelling
+        key_groups: Dict[str, List[Any]] = {}
+        for key in _records_to_columns(records):
+            key_groups.setdefault(str(key).lower(), []).append(key)
+        for keys in key_groups.values():
+            if len(keys) > 1:
+                logger.warning(f"Merging keys {keys} into SQLite column {str(keys[0])!r}; "
+                               f"the first non-null value per row is kept")
+        columns = [str(keys[0]) for keys in key_groups.values()]
+        self._ensure_table(columns)
+        
+        column_sql = ', '.join(_quote_identifier(column) for column in columns)
+        placeholders = ', '.join('?' * len(columns))
+        rows = [
+            tuple(_to_sql_value(next((record[key] for key in keys if record.get(key) is not None), None))
+                  for keys in key_groups.values())
+            for record in records
+        ]
+        self._db.executemany(f'INSERT INTO scraped ({column_sql}) VALUES ({placeholders})', rows)
+        self._db.commit()
+    
+    def _append_record(self, record: Dict[str, Any]) -> None:
+        """Append one record to the column store, padding missing fields with None"""
+        for key in record:
+            if key not in self._cols:
+                self._cols[key] = [None] * self._n_rows
+        for key, column in self._cols.items():
+            column.append(record.get(key))
+        self._n_rows += 1
+    
     def get_random_delay(self) -> float:
         """Generate random delay between requests"""
         return random.uniform(*self.config.delay_range)
     
-    def make_request(self, url: str, retries: int = 0) -> Optional[requests.Response]:
+    def get_backoff_delay(self, attempt: int) -> float:
+        """Generate exponentially growing, jittered delay before a retry, capped at max_backoff"""
+        # Bounding the exponent keeps the float product finite for very large max_retries
+        return min(self.get_random_delay() * 2.0 ** min(attempt, 32), self.config.max_backoff)
+    
+    def make_request(self, url: str) -> Optional[httpx.Response]:
         """Make HTTP request with retry logic"""
-        try:
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
-            return response
-        except requests.RequestException as e:
-            logger.error(f"Request failed for {url}: {e}")
-            if retries < self.config.max_retries:
-                time.sleep(self.get_random_delay())
-                return self.make_request(url, retries + 1)
-            else:
-                self.failed_urls.append(url)
-                return None
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                response = self.session.get(url)
+                response.raise_for_status()
+                return response
+            except httpx.HTTPError as e:
+                logger.error(f"Request failed for {url}: {e}")
+                if attempt < self.config.max_retries:
+                    time.sleep(self.get_backoff_delay(attempt))
+        
+        self.failed_urls.append(url)
+        return None
+    
+    def parse_html(self, html_content: str) -> 'BeautifulSoup':
+        """Parse HTML content using BeautifulSoup with the lxml backend"""
+        # Only link extraction needs bs4, so it is imported on first use
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html_content, 'lxml')
     
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content using BeautifulSoup"""
-        return BeautifulSoup(html_content, 'html.parser')
+    def parse_tree(self, html_content: Union[str, bytes]) -> lxml.html.HtmlElement:
+        """Parse HTML content directly into an lxml element tree"""
+        return lxml.html.fromstring(html_content, parser=self._html_parser)
     
-    def extract_text_data(self, soup: BeautifulSoup, selectors: Dict[str, str]) -> Dict[str, str]:
+    def extract_text_data(self, tree: lxml.html.HtmlElement, selectors: Dict[str, str]) -> Dict[str, str]:
         """Extract text data using CSS selectors"""
+        # Selector maps are compiled once and reused for every page
+        cache_key = tuple(selectors.items())
+        xpaths = self._xpath_cache.get(cache_key)
+        if xpaths is None:
+            xpaths = self._xpath_cache[cache_key] = _compile_selectors(selectors)
+        
         data = {}
-        for key, selector in selectors.items():
-            element = soup.select_one(selector)
-            data[key] = element.get_text(strip=True) if element else ""
+        for key, xpath in xpaths.items():
+            elements = xpath(tree)
+            data[key] = elements[0].text_content().strip() if elements else ""
         return data
     
-    def extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def extract_links(self, soup: 'BeautifulSoup', base_url: str) -> List[str]:
         """Extract all links from a page"""
+        # Parse the base once; each link is then matched against "<scheme>://<netloc>"
+        base_netloc = urlparse(base_url).netloc
+        same_host = re.compile(r'[A-Za-z][A-Za-z0-9+.\-]*://' + re.escape(base_netloc) + r'(?:[/?#]|$)')
+        
         links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            absolute_url = urljoin(base_url, href)
-            if urlparse(absolute_url).netloc == urlparse(base_url).netloc:
+        for link in soup.select('a[href]'):
+            absolute_url = urljoin(base_url, link['href'])
+            if same_host.match(absolute_url):
                 links.append(absolute_url)
         return links
     
@@ -95,8 +269,15 @@ class WebScraper:
         if not response:
             return None
         
-        soup = self.parse_html(response.text)
-        data = self.extract_text_data(soup, selectors)
+        # Raw bytes let lxml honour XML declarations and <meta charset>
+        try:
+            tree = self.parse_tree(response.content)
+        except (etree.ParserError, ValueError) as e:
+            logger.error(f"Could not parse {url}: {e}")
+            self.failed_urls.append(url)
+            return None
+        
+        data = self.extract_text_data(tree, selectors)
         data['url'] = url
         data['scraped_at'] = datetime.now().isoformat()
         
@@ -105,46 +286,107 @@ class WebScraper:
         
         return data
     
-    def scrape_multiple_pages(self, urls: List[str], selectors: Dict[str, str]) -> List[Dict[str, Any]]:
-        """Scrape multiple pages"""
-        scraped_data = []
+    async def _fetch(self, client: httpx.AsyncClient, url: str,
+                     sem: asyncio.Semaphore) -> Optional[bytes]:
+        """Fetch a single URL asynchronously with retry logic"""
+        async with sem:
+            for attempt in range(self.config.max_retries + 1):
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    html_content = response.content
+                    # Jittered delay keeps each concurrency slot polite
+                    await asyncio.sleep(self.get_random_delay())
+                    return html_content
+                except httpx.HTTPError as e:
+                    logger.error(f"Request failed for {url}: {e}")
+                    if attempt < self.config.max_retries:
+                        await asyncio.sleep(self.get_backoff_delay(attempt))
+        
+        self.failed_urls.append(url)
+        return None
+    
+    async def _fetch_and_parse(self, client: httpx.AsyncClient, url: str,
+                               selectors: Dict[str, str],
+                               sem: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Fetch a page and extract data from it"""
+        logger.info(f"Scraping: {url}")
+        
+        html_content = await self._fetch(client, url, sem)
+        if html_content is None:
+            return None
+        
+        # A single unparseable page must not abort the whole gather
+        try:
+            tree = self.parse_tree(html_content)
+        except (etree.ParserError, ValueError) as e:
+            logger.error(f"Could not parse {url}: {e}")
+            self.failed_urls.append(url)
+            return None
         
-        for i, url in enumerate(urls[:self.config.max_pages]):
-            data = self.scrape_page(url, selectors)
-            if data:
-                scraped_data.append(data)
-                logger.info(f"Successfully scraped page {i+1}/{len(urls[:self.config.max_pages])}")
+        data = self.extract_text_data(tree, selectors)
+        data['url'] = url
+        data['scraped_at'] = datetime.now().isoformat()
+        return data
+    
+    async def _scrape_all(self, urls: List[str], selectors: Dict[str, str]) -> List[Optional[Dict[str, Any]]]:
+        """Scrape all URLs concurrently over a single pooled HTTP/2 client"""
+        sem = asyncio.Semaphore(self.config.max_concurrency)
         
-        self.scraped_data.extend(scraped_data)
+        async with httpx.AsyncClient(http2=True, headers=self.config.headers, timeout=self.config.timeout,
+                                     limits=_HTTP_LIMITS, follow_redirects=True) as client:
+            return await asyncio.gather(
+                *(self._fetch_and_parse(client, url, selectors, sem) for url in urls)
+            )
+    
+    def scrape_multiple_pages(self, urls: List[str], selectors: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Scrape multiple pages concurrently"""
+        urls = urls[:self.config.max_pages]
+        results = asyncio.run(self._scrape_all(urls, selectors))
+        scraped_data = [data for data in results if data]
+        logger.info(f"Successfully scraped {len(scraped_data)}/{len(urls)} pages")
+        
+        for data in scraped_data:
+            self._append_record(data)
+        self._persist_records(scraped_data)
         return scraped_data
     
     def save_to_csv(self, filename: str = "scraped_data.csv") -> None:
         """Save scraped data to CSV file"""
-        if not self.scraped_data:
+        if not self._n_rows:
             logger.warning("No data to save")
             return
         
-        df = pd.DataFrame(self.scraped_data)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        try:
+            pacsv.write_csv(pa.Table.from_pydict(self._cols), filename)
+        except pa.ArrowException:
+            # Mixed-type columns have no Arrow CSV representation
+            pd.DataFrame(self._cols).to_csv(filename, index=False, encoding='utf-8')
         logger.info(f"Data saved to {filename}")
     
     def save_to_json(self, filename: str = "scraped_data.json") -> None:
         """Save scraped data to JSON file"""
-        if not self.scraped_data:
+        if not self._n_rows:
             logger.warning("No data to save")
             return
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.scraped_data, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(self.scraped_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         logger.info(f"Data saved to {filename}")
 
 class APIClient:
     """Class for API integration and data collection"""
     
-    def __init__(self, base_url: str, api_key: str = None):
+    def __init__(self, base_url: str, api_key: str = None, requests_per_second: float = 5.0,
+                 timeout: Optional[float] = 30.0):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
-        self.session = requests.Session()
+        # httpx would otherwise apply a 5 second default; None disables the timeout
+        self.session = httpx.Client(http2=True, timeout=timeout, limits=_HTTP_LIMITS,
+                                    follow_redirects=True)
+        self.min_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
         
         if api_key:
             self.session.headers.update({'Authorization': f'Bearer {api_key}'})
@@ -154,10 +396,21 @@ class APIClient:
             'User-Agent': 'Python-API-Client/1.0'
         })
     
+    def _wait_for_rate_limit(self) -> None:
+        """Space out requests, including those made from worker threads"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.min_interval
+        
+        if wait > 0:
+            time.sleep(wait)
+    
     def make_api_request(self, endpoint: str, method: str = 'GET', 
                         params: Dict = None, data: Dict = None) -> Optional[Dict]:
         """Make API request with error handling"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        self._wait_for_rate_limit()
         
         try:
             if method.upper() == 'GET':
@@ -171,45 +424,72 @@ class APIClient:
             response.raise_for_status()
             return response.json()
             
-        except requests.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError covers response bodies that are not valid JSON
             logger.error(f"API request failed: {e}")
             return None
     
+    def _split_page(self, data: Any) -> Tuple[List[Dict], bool]:
+        """Split a page response into its records and whether more pages follow"""
+        # Handle different pagination formats
+        if isinstance(data, list):
+            return data, len(data) > 0
+        if 'data' in data:
+            return data['data'], data.get('has_next', True)
+        if 'results' in data:
+            return data['results'], bool(data.get('next'))
+        return [data], False
+    
+    def _total_pages(self, data: Any, page_size: int) -> Optional[int]:
+        """Read the total page count from a response, if the API reports one"""
+        if not isinstance(data, dict):
+            return None
+        for key in ('total_pages', 'last_page'):
+            if data.get(key):
+                return int(data[key])
+        if data.get('count') and page_size:
+            return math.ceil(data['count'] / page_size)
+        return None
+    
     def get_paginated_data(self, endpoint: str, params: Dict = None, 
-                          max_pages: int = 10) -> List[Dict]:
+                          max_pages: int = 10, max_workers: int = 8) -> List[Dict]:
         """Fetch paginated data from API"""
-        all_data = []
-        page = 1
+        params = dict(params or {})
         
-        while page <= max_pages:
-            if params is None:
-                params = {}
-            params['page'] = page
-            
-            data = self.make_api_request(endpoint, params=params)
+        data = self.make_api_request(endpoint, params={**params, 'page': 1})
+        if not data:
+            return []
+        
+        records, has_next = self._split_page(data)
+        all_data = list(records)
+        if not has_next:
+            return all_data
+        
+        last_page = self._total_pages(data, len(records))
+        if last_page:
+            # Page count is known up front, so fetch the remaining pages concurrently
+            last_page = min(last_page, max_pages)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self.make_api_request, endpoint, params={**params, 'page': page})
+                    for page in range(2, last_page + 1)
+                ]
+                # Collect in submission order so records keep their page order
+                for future in futures:
+                    data = future.result()
+                    if data:
+                        all_data.extend(self._split_page(data)[0])
+            return all_data
+        
+        page = 2
+        while has_next and page <= max_pages:
+            data = self.make_api_request(endpoint, params={**params, 'page': page})
             if not data:
                 break
             
-            # Handle different pagination formats
-            if isinstance(data, list):
-                all_data.extend(data)
-                if len(data) == 0:
-                    break
-            elif isinstance(data, dict):
-                if 'data' in data:
-                    all_data.extend(data['data'])
-                    if not data.get('has_next', True):
-                        break
-                elif 'results' in data:
-                    all_data.extend(data['results'])
-                    if not data.get('next'):
-                        break
-                else:
-                    all_data.append(data)
-                    break
-            
+            records, has_next = self._split_page(data)
+            all_data.extend(records)
             page += 1
-            time.sleep(1)  # Rate limiting
         
         return all_data
 
@@ -225,51 +505,72 @@ class DataProcessor:
             return ""
         
         # Remove extra whitespace
-        text = ' '.join(text.split())
+        text = _WS_RE.sub(' ', text)
         
         # Remove special characters (keep alphanumeric and basic punctuation)
-        import re
-        text = re.sub(r'[^\w\s\.\,\!\?\-\:]', '', text)
+        text = _CLEAN_RE.sub('', text)
         
         return text.strip()
     
+    def clean_text_column(self, column: pd.Series) -> pd.Series:
+        """Clean every string in a column with vectorized regex replacement"""
+        if pd.api.types.infer_dtype(column, skipna=True) == 'string':
+            is_text = None
+            text = column
+        else:
+            # Mixed column: only the string values get cleaned
+            is_text = column.map(lambda value: isinstance(value, str))
+            text = column[is_text].astype(str)
+        
+        cleaned = (text.str.replace(_WS_RE, ' ', regex=True)
+                   .str.replace(_CLEAN_RE, '', regex=True)
+                   .str.strip())
+        return cleaned if is_text is None else column.where(~is_text, cleaned)
+    
     def process_scraped_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process and clean scraped data"""
-        processed = []
+        if not data:
+            self.processed_data = []
+            return []
+        
+        df = pd.DataFrame(data)
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            df[col] = self.clean_text_column(df[col])
         
-        for item in data:
-            processed_item = {}
-            for key, value in item.items():
-                if isinstance(value, str):
-                    processed_item[key] = self.clean_text(value)
-                else:
-                    processed_item[key] = value
-            processed.append(processed_item)
+        # Only string values are replaced, so each record keeps its own keys
+        # and non-string values come through untouched
+        records = df.to_dict('records')
+        processed = [
+            {key: row[key] if isinstance(value, str) else value for key, value in item.items()}
+            for item, row in zip(data, records)
+        ]
         
         self.processed_data = processed
         return processed
     
-    def analyze_data(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Perform basic analysis on the data"""
+    def analyze_data(self, data: Union[List[Dict[str, Any]], Dict[str, List[Any]]]) -> Dict[str, Any]:
+        """Perform basic analysis on records or on a column store"""
         if not data:
             return {}
         
-        df = pd.DataFrame(data)
+        columns = data if isinstance(data, dict) else _records_to_columns(data)
+        df = pd.DataFrame(columns)
         analysis = {
-            'total_records': len(data),
+            'total_records': len(df),
             'columns': list(df.columns),
             'data_types': df.dtypes.to_dict(),
             'missing_values': df.isnull().sum().to_dict()
         }
         
         # Text analysis for string columns
-        text_columns = df.select_dtypes(include=['object']).columns
+        text_columns = df.select_dtypes(include=['object', 'string']).columns
         for col in text_columns:
             if col in df.columns:
+                values = np.fromiter(columns[col], dtype=object, count=len(df))
                 analysis[f'{col}_analysis'] = {
                     'unique_values': df[col].nunique(),
-                    'most_common': df[col].value_counts().head(5).to_dict(),
-                    'average_length': df[col].str.len().mean() if df[col].dtype == 'object' else None
+                    'most_common': _top_k_counts(values),
+                    'average_length': _mean_text_length(columns[col])
                 }
         
         return analysis
@@ -336,6 +637,7 @@ def main():
     scraper.scraped_data = processed_data
     scraper.save_to_csv("combined_data.csv")
     scraper.save_to_json("combined_data.json")
+    scraper.close()
     
     print("\n=== Processing Complete ===")
     print("Check 'combined_data.csv' and 'combined_data.json' for results")